@@ -80,6 +80,15 @@ if __name__ == "__main__":
     It applies custom CSS and launches the PyWebIO application on a specified port.
     """
     logger.info("Application script started.")
+    # Use uvloop for the asyncio event loop when available; it cuts
+    # per-callback overhead on the I/O-heavy PyWebIO/Meraki flows and is a
+    # drop-in replacement, so its absence is not an error.
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("uvloop installed as the asyncio event loop policy.")
+    except ImportError:
+        pass
     # Apply custom CSS styles from the wrapper module for UI customization.
     config(css_style=UI.get_css_style())
     # Start PyWebIO server on port 8080 with debug enabled for development.
@@ -5,16 +5,67 @@ This module contains the core business logic for the application,
 encapsulated in the ProjectLogic class. It interacts with the Meraki API
 through the MerakiAPIWrapper to perform specific operations.
 """
+import asyncio
+import concurrent.futures
+import time
+from collections import Counter
 import meraki
+import pandas as pd
+import meraki.aio
 from meraki_tools.my_logging import get_logger
 from meraki_tools.meraki_api_utils import MerakiAPIWrapper
 from logging import Logger # Import Logger for type hinting
-from typing import Any, Dict, List, Tuple, Optional # Import types for better type hinting, added Optional
+from typing import Any, Dict, List, Set, Tuple, Optional # Import types for better type hinting, added Optional
 from datetime import datetime, timedelta # Import for date/time calculations in new functions
 
 # Initialize a module-level logger.
 logger: Logger = get_logger()
 
+# Upper bound on concurrent per-network event fetches (one task per network,
+# gated by an asyncio.Semaphore). Sized to the Meraki Dashboard limit of 5
+# concurrent calls per organization so the fan-out stays at the maximum safe
+# concurrency instead of tripping the rate limiter.
+MAX_CONCURRENT_NETWORK_FETCHES: int = 5
+
+# Rate-limit (HTTP 429) handling for the per-network fetch tasks: how many
+# times one network retries and how long to wait when no Retry-After header
+# is present.
+MAX_RATE_LIMIT_RETRIES: int = 5
+RATE_LIMIT_DEFAULT_COOLDOWN: float = 5.0
+
+
+def aggregate_page_events(events: List[Dict[str, Any]]) -> List[Tuple[Tuple[str, str], int]]:
+    """
+    Aggregates one page of events into ((date_str, event_type), count) pairs.
+
+    A module-level pure function with no instance state, so it can be handed
+    to a ProcessPoolExecutor unchanged if page aggregation ever becomes the
+    bottleneck. With pages capped at 1000 events the pandas groupby here is
+    dwarfed by network I/O, so it currently runs in-process: pickling the
+    event dicts to a worker process would cost more than the aggregation.
+
+    Args:
+        events: Event dicts, each with 'occurredAt' and 'type' keys.
+
+    Returns:
+        A list of ((date_str, event_type), count) tuples with nonzero counts.
+    """
+    # The date is the fixed-width ISO-8601 prefix, so slicing and counting
+    # both run vectorized in C instead of a per-event Python loop.
+    df = pd.DataFrame(events, columns=['occurredAt', 'type'])
+    df['date'] = df['occurredAt'].str.slice(0, 10)
+    grouped = df.groupby(['date', 'type']).size()
+    return [((date_str, event_type), int(count)) for (date_str, event_type), count in grouped.items()]
+
+# Worker count for the thread pool fetching per-network event-type schemas.
+# Kept at the Meraki Dashboard limit of 5 concurrent calls per organization.
+MAX_EVENT_TYPE_FETCH_WORKERS: int = 5
+
+# How long cached list_networks results stay valid, in seconds. A single user
+# interaction calls list_networks several times with the same filter, so a
+# short TTL removes the duplicated API round trips without serving stale data.
+NETWORKS_CACHE_TTL_SECONDS: float = 300.0
+
 class ProjectLogic:
     """
     Encapsulates the business logic for the application.
@@ -35,8 +86,62 @@ class ProjectLogic:
         """
         self._api_utils = api_utils
         self.logger = get_logger()
+        # TTL cache for list_networks results, keyed by the product-type filter.
+        self._networks_cache: Dict[Tuple[str, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+        # Event types each network actually supports, filled as a side effect of
+        # get_filtered_event_types and used to skip pointless event fetches.
+        self._net_event_type_cache: Dict[str, Set[str]] = {}
         self.logger.info("ProjectLogic initialized with API_Utils instance.")
 
+    def _list_networks_cached(self, filter_product_type: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the organization's networks, reusing a recent cached result when available.
+
+        Args:
+            filter_product_type: Optional list of product types to filter networks by.
+
+        Returns:
+            A list of network dictionaries (empty on error), as from list_networks.
+        """
+        cache_key: Tuple[str, ...] = tuple(sorted(filter_product_type or []))
+        cached = self._networks_cache.get(cache_key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < NETWORKS_CACHE_TTL_SECONDS:
+            self.logger.debug(f"Using cached networks list for product types {cache_key or 'all'}.")
+            return cached[1]
+
+        networks = self._api_utils.list_networks(filter_product_type=filter_product_type)
+        if not isinstance(networks, list):
+            # Error dictionaries from the wrapper are not cached.
+            self.logger.error(f"list_networks returned an error: {networks}")
+            return []
+        self._networks_cache[cache_key] = (now, networks)
+        return networks
+
+    def _network_id_name_pairs(self, networks: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """
+        Converts raw network dicts into compact (id, name) tuples.
+
+        Networks without an ID are dropped (with a warning) here, once, so the
+        hot loops iterate plain tuples instead of repeating dict lookups and
+        missing-ID branches per iteration.
+
+        Args:
+            networks: Network dictionaries as returned by list_networks.
+
+        Returns:
+            A list of (network_id, network_name) tuples.
+        """
+        pairs: List[Tuple[str, str]] = []
+        for net in networks:
+            network_id = net.get('id')
+            network_name = net.get('name', 'Unknown')
+            if not network_id:
+                self.logger.warning(f"Skipping network with missing ID: {network_name}")
+                continue
+            pairs.append((network_id, network_name))
+        return pairs
+
     def get_unique_product_types(self) -> List[str]:
         """
         Retrieves a list of unique product types from all networks in the organization.
@@ -45,24 +150,27 @@ class ProjectLogic:
         Returns:
             A sorted list of unique product type strings (e.g., ['wireless', 'appliance']).
         """
-        unique_product_types: Set[str] = set()
         try:
-            networks = self._api_utils.list_networks()
-            for network in networks:
-                if 'productTypes' in network and isinstance(network['productTypes'], list):
-                    for product_type in network['productTypes']:
-                        unique_product_types.add(product_type)
+            networks = self._list_networks_cached()
+            # A single set comprehension runs entirely on the C path, avoiding
+            # the per-element .add calls and isinstance branches of the old loop.
+            unique_product_types = {
+                product_type
+                for network in networks
+                for product_type in (network.get('productTypes') or [])
+                if isinstance(product_type, str)
+            }
         except Exception as e:
             logger.error(f"Error fetching unique product types: {e}", exc_info=True)
             # In a real application, you might want to return a default list
             # or raise the exception depending on how critical this data is.
             return [] # Return an empty list on error
 
-        return sorted(list(unique_product_types))
+        return sorted(unique_product_types)
     
-    def get_filtered_event_types(self, product_type: str, event_category: Optional[str] = None) -> Tuple[List[str], List[Dict[str, Any]]]:
+    def get_filtered_event_types(self, product_type: str, event_category: Optional[str] = None) -> List[Dict[str, str]]:
         """
-        Fetches unique event types for networks matching a product type and optionally filters them by category.
+        Fetches unique event definitions for networks matching a product type and optionally filters them by category.
 
         Args:
             product_type: The product type to filter networks (e.g., 'wireless').
@@ -70,52 +178,57 @@ class ProjectLogic:
                             If None, all unique event types across all categories will be returned.
 
         Returns:
-            A tuple: (sorted list of event type strings, list of networks matching product_type).
+            A sorted list of {'category', 'type', 'description'} definition
+            dictionaries; empty on error or when no networks match.
         """
         dashboard: meraki.DashboardAPI | None = self._api_utils.get_dashboard()
         if not dashboard:
             self.logger.error("Could not obtain Meraki Dashboard API object in ProjectLogic for get_filtered_event_types.")
-            return [], []
+            return []
 
         self.logger.info(f"Fetching all networks and filtering by product type '{product_type}'...")
         all_networks: List[Dict[str, Any]] = []
         try:
-            all_networks = self._api_utils.list_networks(filter_product_type=[product_type])
+            all_networks = self._list_networks_cached(filter_product_type=[product_type])
         except meraki.APIError as e:
             self.logger.error(f"Meraki API Error fetching all networks: {e}")
-            return [], []
+            return []
         except Exception as e:
             self.logger.exception(f"An unexpected error occurred while fetching all networks: {e}")
-            return [], []
-
-        if not all_networks:
-            self.logger.warning("No networks found using _api_utils.list_networks().")
-            return [], []
+            return []
 
         if not all_networks:
             self.logger.warning(f"No networks found matching product type '{product_type}'.")
-            return [], []
+            return []
+
+        target_networks = self._network_id_name_pairs(all_networks)
 
+        # Each getNetworkEventsEventTypes call is an independent HTTPS round trip,
+        # so they are issued concurrently from a thread pool instead of serially.
         unique_event_types_set = set()
-        for net in all_networks:
-            network_id = net.get('id')
-            network_name = net.get('name', 'Unknown')
-            if not network_id:
-                self.logger.warning(f"Skipping network with missing ID: {network_name}")
-                continue
-            try:
-                event_types_for_net = dashboard.networks.getNetworkEventsEventTypes(
-                    network_id
-                )
-                for event in event_types_for_net:
-                    event_tuple = (event.get('category'), event.get('type'), event.get('description'))
-                    unique_event_types_set.add(event_tuple)
-            except meraki.APIError as e:
-                self.logger.error(f"Error fetching event types for network {network_name} ({network_id}): {e}")
-                continue
-            except Exception as e:
-                self.logger.exception(f"An unexpected error occurred while fetching event types for network {network_name} ({network_id}): {e}")
-                continue
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_EVENT_TYPE_FETCH_WORKERS) as executor:
+            future_to_network = {
+                executor.submit(dashboard.networks.getNetworkEventsEventTypes, network_id): (network_id, network_name)
+                for network_id, network_name in target_networks
+            }
+            for future in concurrent.futures.as_completed(future_to_network):
+                network_id, network_name = future_to_network[future]
+                try:
+                    event_types_for_net = future.result()
+                    for event in event_types_for_net:
+                        event_tuple = (event.get('category'), event.get('type'), event.get('description'))
+                        unique_event_types_set.add(event_tuple)
+                    # Remember which event types this network supports so
+                    # get_network_event_counts can skip it when none match.
+                    self._net_event_type_cache[network_id] = {
+                        event.get('type') for event in event_types_for_net if event.get('type')
+                    }
+                except meraki.APIError as e:
+                    self.logger.error(f"Error fetching event types for network {network_name} ({network_id}): {e}")
+                    continue
+                except Exception as e:
+                    self.logger.exception(f"An unexpected error occurred while fetching event types for network {network_name} ({network_id}): {e}")
+                    continue
 
         all_unique_event_definitions: List[Dict[str, str]] = []
         for event_tuple in unique_event_types_set:
@@ -125,25 +238,21 @@ class ProjectLogic:
                 "description": event_tuple[2] if event_tuple[2] is not None else ""
             })
 
-        # Sort the list of dictionaries by the 'category' key
-        all_unique_event_definitions_sorted = sorted(all_unique_event_definitions, key=lambda x: str(x.get('category', '')))
-                # Sort the list of dictionaries by the 'category' key, then by 'type'
-        all_unique_event_definitions_sorted = sorted(
-            all_unique_event_definitions, 
-            key=lambda x: (str(x.get('category', '')), str(x.get('type', '')))
-        )
-
-        # Apply category filter if specified
+        # Apply the category filter before sorting so only the surviving subset
+        # pays the O(N log N) sort.
         if event_category:
             filtered_definitions = [
-                event_def for event_def in all_unique_event_definitions_sorted
+                event_def for event_def in all_unique_event_definitions
                 if event_def.get('category') == event_category
             ]
+            filtered_definitions.sort(key=lambda x: (str(x.get('category', '')), str(x.get('type', ''))))
             self.logger.info(f"Found {len(filtered_definitions)} '{event_category}' event definitions for product type '{product_type}'.")
             return filtered_definitions
         else:
-            self.logger.info(f"Found {len(all_unique_event_definitions_sorted)} unique event definitions across all categories for product type '{product_type}'.")
-            return all_unique_event_definitions_sorted
+            # Sort the list of dictionaries by the 'category' key, then by 'type'
+            all_unique_event_definitions.sort(key=lambda x: (str(x.get('category', '')), str(x.get('type', ''))))
+            self.logger.info(f"Found {len(all_unique_event_definitions)} unique event definitions across all categories for product type '{product_type}'.")
+            return all_unique_event_definitions
 
     def get_network_event_counts(self, product_type: str, selected_event_types: List[str], days_lookback: int) -> Dict[str, Dict[str, Dict[str, int]]]:
         """
@@ -159,39 +268,171 @@ class ProjectLogic:
         Returns:
             A dictionary: {network_id: {date_str: {event_type: count}}}.
         """
-        dashboard: meraki.DashboardAPI | None = self._api_utils.get_dashboard()
-        if not dashboard:
-            self.logger.error("Could not obtain Meraki Dashboard API object in ProjectLogic for get_network_event_counts.")
-            return {}
+        flat_counts = self._collect_event_counts(product_type, selected_event_types, days_lookback)
+
+        # Reshape the flat (network_id, date, type) counter into the nested
+        # mapping existing callers consume.
+        network_event_counts: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for (network_id, event_date_str, event_type), count in flat_counts.items():
+            network_event_counts.setdefault(network_id, {}).setdefault(event_date_str, {})[event_type] = count
+        return network_event_counts
 
+    def _collect_event_counts(self, product_type: str, selected_event_types: List[str], days_lookback: int) -> Counter:
+        """
+        Runs the concurrent event collection and returns flat counts.
+
+        Args:
+            product_type: The product type to filter events (e.g., 'wireless').
+            selected_event_types: A list of event type strings to search for.
+            days_lookback: The number of days to look back for events.
+
+        Returns:
+            A Counter keyed by (network_id, date_str, event_type).
+        """
         if not selected_event_types:
             self.logger.warning("No event types provided for search. Returning empty counts.")
-            return {}
+            return Counter()
 
         end_time = datetime.now()
         start_time = end_time - timedelta(days=days_lookback)
         occurred_after_str = start_time.isoformat(timespec='seconds') + 'Z'
-        # Convert to datetime object for comparison in pagination
-        occurred_after_dt = datetime.fromisoformat(occurred_after_str.replace('Z', '+00:00'))
 
-        network_event_counts: Dict[str, Dict[str, Dict[str, int]]] = {}
         self.logger.info(f"Collecting events for the last {days_lookback} days (since {occurred_after_str})...")
-        networks_list = self._api_utils.list_networks(filter_product_type=[product_type])
-        for net in networks_list:
-            network_id = net.get('id')
-            network_name = net.get('name', 'Unknown')
-            if not network_id:
-                self.logger.warning(f"Skipping network with missing ID: {network_name}")
-                continue
+        networks_list = self._list_networks_cached(filter_product_type=[product_type])
+
+        # The per-network fetches are independent HTTPS round trips, so they are
+        # fanned out concurrently on the async Meraki client instead of being
+        # paginated one network at a time.
+        return asyncio.run(
+            self._collect_event_counts_async(
+                networks_list, product_type, selected_event_types, occurred_after_str
+            )
+        )
+
+    async def _collect_event_counts_async(
+        self,
+        networks_list: List[Dict[str, Any]],
+        product_type: str,
+        selected_event_types: List[str],
+        occurred_after_str: str,
+    ) -> Counter:
+        """
+        Fetches and counts events for all networks concurrently, one task per network.
+
+        Args:
+            networks_list: Networks to fetch events for (from list_networks).
+            product_type: The product type to filter events (e.g., 'wireless').
+            selected_event_types: A list of event type strings to search for.
+            occurred_after_str: ISO-8601 lower bound for event timestamps.
+
+        Returns:
+            A Counter keyed by (network_id, date_str, event_type).
+        """
+        target_networks: List[Tuple[str, str, List[str]]] = []
+        for network_id, network_name in self._network_id_name_pairs(networks_list):
+            # Intersect the selection with the event types this network is known
+            # to support (cached by get_filtered_event_types): networks that can
+            # produce no matching events are skipped without any API call, and
+            # partially matching networks get a shorter includedEventTypes list.
+            supported_types = self._net_event_type_cache.get(network_id)
+            if supported_types is None:
+                net_event_types = selected_event_types
+            else:
+                net_event_types = [t for t in selected_event_types if t in supported_types]
+                if not net_event_types:
+                    self.logger.debug(f"  Skipping network {network_name} ({network_id}): none of the selected event types are supported.")
+                    continue
+            target_networks.append((network_id, network_name, net_event_types))
+
+        # Short-circuit before building any client or task machinery when the
+        # preflight filter leaves nothing to fetch.
+        if not target_networks:
+            self.logger.info("No networks can produce the selected event types. Skipping event collection entirely.")
+            return Counter()
+
+        aiomeraki = self._api_utils.create_async_dashboard()
+        if aiomeraki is None:
+            self.logger.error("Could not obtain Meraki AsyncDashboardAPI object in ProjectLogic for get_network_event_counts.")
+            return Counter()
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_NETWORK_FETCHES)
+        # One flat counter for the whole run: a single dict keyed by
+        # (network_id, date, type) tuples instead of three levels of nested
+        # dicts, which is both denser and cheaper to merge into.
+        flat_counts: Counter = Counter()
+
+        # Producer/consumer split: the per-network producers only do network
+        # I/O and hand raw pages to this queue; a single consumer coroutine
+        # does the CPU-side counting. This pipelines fetching and aggregation
+        # so total wall time approaches max(network, cpu) instead of their sum.
+        page_queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_CONCURRENT_NETWORK_FETCHES * 2)
+
+        async def _consume_pages() -> None:
+            while True:
+                item = await page_queue.get()
+                if item is None:
+                    break
+                network_id, network_name, page_events = item
+                self._count_page_events(page_events, network_id, flat_counts, network_name)
+
+        async with aiomeraki:
+            consumer = asyncio.create_task(_consume_pages())
+            tasks = [
+                asyncio.create_task(
+                    self._fetch_network_events(
+                        aiomeraki, semaphore, page_queue, network_id, network_name,
+                        product_type, net_event_types, occurred_after_str
+                    )
+                )
+                for network_id, network_name, net_event_types in target_networks
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # All producers are done; the sentinel lands behind any queued pages.
+            await page_queue.put(None)
+            await consumer
+
+        for (network_id, network_name, _), result in zip(target_networks, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"  Event fetch task failed for network {network_name} ({network_id}): {result}")
+        return flat_counts
+
+    async def _fetch_network_events(
+        self,
+        aiomeraki: "meraki.aio.AsyncDashboardAPI",
+        semaphore: asyncio.Semaphore,
+        page_queue: asyncio.Queue,
+        network_id: str,
+        network_name: str,
+        product_type: str,
+        selected_event_types: List[str],
+        occurred_after_str: str,
+    ) -> None:
+        """
+        Paginates getNetworkEvents for a single network, producing raw pages.
+        Implements manual pagination using 'endingBefore'. Each fetched page is
+        pushed onto the shared queue for the consumer to count, so this
+        coroutine stays purely I/O-bound.
 
+        Args:
+            aiomeraki: The async Meraki Dashboard API client.
+            semaphore: Semaphore bounding the number of concurrent network fetches.
+            page_queue: Queue receiving (network_id, network_name, page_events) tuples.
+            network_id: The ID of the network to fetch events for.
+            network_name: The network name, for logging.
+            product_type: The product type to filter events (e.g., 'wireless').
+            selected_event_types: A list of event type strings to search for.
+            occurred_after_str: ISO-8601 lower bound for event timestamps.
+        """
+        async with semaphore:
             self.logger.info(f"  Fetching events for network: {network_name} ({network_id})...")
 
-            all_network_events_for_current_net: List[Dict[str, Any]] = []
+            total_events = 0
             ending_before_timestamp: str | None = None # Used for pagination
             loop_count = 0
+            rate_limit_retries = 0
             while True:
                 try:
-                    response_data: Dict[str, Any] = dashboard.networks.getNetworkEvents(
+                    response_data: Dict[str, Any] = await aiomeraki.networks.getNetworkEvents(
                         network_id,
                         productType=product_type,
                         includedEventTypes=selected_event_types,
@@ -207,14 +448,16 @@ class ProjectLogic:
                         self.logger.debug(f"    No more events returned for network {network_name}. Breaking pagination.")
                         break # No more events were returned
 
-                    all_network_events_for_current_net.extend(current_page_events)
+                    total_events += len(current_page_events)
+                    await page_queue.put((network_id, network_name, current_page_events))
 
                     page_start_at_str = response_data.get('pageStartAt')
                     if page_start_at_str:
-                        page_start_at_dt = datetime.fromisoformat(page_start_at_str.replace('Z', '+00:00'))
-
-                        if page_start_at_dt <= occurred_after_dt:
-                            self.logger.debug(f"    Reached or passed occurredAfter ({occurred_after_dt}) for network {network_name}. Breaking pagination.")
+                        # Both timestamps are UTC ISO-8601 in the same format,
+                        # which compares correctly lexicographically — no need
+                        # to allocate a datetime per page.
+                        if page_start_at_str <= occurred_after_str:
+                            self.logger.debug(f"    Reached or passed occurredAfter ({occurred_after_str}) for network {network_name}. Breaking pagination.")
                             break # Reached or passed the target start time
                     else:
                         # Fallback if pageStartAt is missing, assume last page if less than perPage
@@ -231,42 +474,54 @@ class ProjectLogic:
                     ending_before_timestamp = page_start_at_str # For the next iteration
 
                 except meraki.APIError as e:
+                    if getattr(e, 'status', None) == 429 and rate_limit_retries < MAX_RATE_LIMIT_RETRIES:
+                        # Back off for exactly as long as the API asks via the
+                        # Retry-After header, then retry the same page.
+                        headers = getattr(getattr(e, 'response', None), 'headers', None) or {}
+                        try:
+                            retry_after = float(headers.get('Retry-After', RATE_LIMIT_DEFAULT_COOLDOWN))
+                        except (TypeError, ValueError):
+                            retry_after = RATE_LIMIT_DEFAULT_COOLDOWN
+                        rate_limit_retries += 1
+                        self.logger.warning(f"  Rate limited fetching events for network {network_name}; retrying in {retry_after}s (attempt {rate_limit_retries}/{MAX_RATE_LIMIT_RETRIES}).")
+                        await asyncio.sleep(retry_after)
+                        continue
                     self.logger.error(f"  Meraki API Error fetching events for network {network_name} ({network_id}): {e}")
                     break
                 except Exception as e:
                     self.logger.exception(f"  An unexpected error occurred during pagination for network {network_name} ({network_id}): {e}")
                     break
             self.logger.debug(f"Finished fetching all pages for network {network_name}")
-            network_events = all_network_events_for_current_net
-
-            if network_events:
-                self.logger.info(f"    Found {len(network_events)} events for network {network_name}.")
-                network_event_counts[network_id] = {}
-                for event in network_events:
-                    if not isinstance(event, dict):
-                        self.logger.warning(f"    Skipping malformed event (not a dictionary) in network {network_name}: {event}")
-                        continue
-                    if 'occurredAt' not in event or 'type' not in event:
-                        self.logger.warning(f"    Skipping event with missing 'occurredAt' or 'type' in network {network_name}: {event}")
-                        continue
 
-                    try:
-                        event_dt = datetime.fromisoformat(event['occurredAt'].replace('Z', '+00:00'))
-                        event_date_str = event_dt.strftime('%Y-%m-%d')
-                        event_type = event['type']
+        if total_events:
+            self.logger.info(f"    Found {total_events} events for network {network_name}.")
+        else:
+            self.logger.info(f"    No events found for network {network_name}.")
 
-                        if event_date_str not in network_event_counts[network_id]:
-                            network_event_counts[network_id][event_date_str] = {}
+    def _count_page_events(self, page_events: List[Dict[str, Any]], network_id: str, flat_counts: Counter, network_name: str) -> int:
+        """
+        Counts one page of events into the flat running counts.
 
-                        network_event_counts[network_id][event_date_str].setdefault(event_type, 0)
-                        network_event_counts[network_id][event_date_str][event_type] += 1
-                    except ValueError as e:
-                        self.logger.error(f"    Error parsing 'occurredAt' for event in network {network_name}: {event.get('occurredAt')}. Error: {e}")
-                        continue
-                    except Exception as e:
-                        self.logger.exception(f"    An unexpected error occurred while processing event in network {network_name}: {event}. Error: {e}")
-                        continue
-            else:
-                self.logger.info(f"    No events found for network {network_name}.")
+        Args:
+            page_events: The events returned by one getNetworkEvents page.
+            network_id: The ID of the network the page belongs to.
+            flat_counts: The (network_id, date_str, event_type) -> count accumulator.
+            network_name: The network name, for logging.
 
-        return network_event_counts
\ No newline at end of file
+        Returns:
+            The number of valid events counted from this page.
+        """
+        valid_events = [
+            event for event in page_events
+            if isinstance(event, dict) and 'occurredAt' in event and 'type' in event
+        ]
+        if len(valid_events) != len(page_events):
+            self.logger.warning(f"    Skipped {len(page_events) - len(valid_events)} malformed events in network {network_name}.")
+
+        if valid_events:
+            try:
+                for (event_date_str, event_type), count in aggregate_page_events(valid_events):
+                    flat_counts[(network_id, event_date_str, event_type)] += count
+            except Exception as e:
+                self.logger.exception(f"    An unexpected error occurred while counting events in network {network_name}: {e}")
+        return len(valid_events)
\ No newline at end of file
@@ -6,17 +6,26 @@ and handling user interactions within the PyWebIO application.
 It integrates with the Meraki API utilities and project-specific business logic.
 """
 # Standard library imports
+import concurrent.futures
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import os
+import time
+import uuid
 from typing import Any, Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 
 # Third-party library imports
+import numpy as np
 import pandas as pd
-from pyecharts import options as opts
-from pyecharts.charts import Line, Page
-from pywebio.output import toast, use_scope, put_buttons, put_markdown, put_text, put_html,put_loading,clear
+from pywebio.output import toast, use_scope, put_buttons, put_markdown, put_text, put_html,put_loading
 from pywebio.input import input_group, checkbox, actions, input as pywebio_input, select
 
+from meraki.exceptions import APIError
+
 # Project-specific imports
 from meraki_tools.my_logging import get_logger
 from project_logic import ProjectLogic  # type: ignore
@@ -25,6 +34,75 @@ from meraki_tools.meraki_api_utils import MerakiAPIWrapper
 # Initialize a module-level logger.
 logger: logging.Logger = get_logger()
 
+# How long a fetched set of event counts stays fresh for identical report
+# parameters before the Meraki API is consulted again.
+EVENT_COUNTS_CACHE_TTL_SECONDS: float = 300.0
+
+# Default cap on per-network lines drawn in each chart; busier networks win
+# and the remainder is aggregated into a single 'Other' series.
+DEFAULT_MAX_NETWORK_SERIES: int = 10
+
+# On-disk cache for fetched event counts; entries are keyed by a digest of
+# the report parameters (including the calendar day, matching the daily
+# aggregation granularity) and survive process restarts.
+EVENT_COUNTS_DISK_CACHE_DIR: str = ".cache_events"
+EVENT_COUNTS_DISK_CACHE_MAX_AGE_SECONDS: float = 86400.0
+
+# Repeat clicks on the same navigation button within this window are
+# coalesced into a single dispatch.
+NAVIGATION_DEBOUNCE_SECONDS: float = 0.25
+
+# Shared "Back to Main Menu" button spec, built once at import time so the
+# per-render put_buttons calls skip the list/dict construction.
+_BACK_TO_MAIN_MENU_BUTTONS: List[Dict[str, str]] = [
+    {"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}
+]
+
+# Identical error toasts within this window are suppressed, so a bursty
+# failure doesn't stack persistent toasts on the page.
+ERROR_TOAST_SUPPRESS_SECONDS: float = 5.0
+
+# Errors that recur in normal operation (rate limits, flaky connectivity)
+# and don't warrant a full stack capture per occurrence.
+_TRANSIENT_ERRORS: Tuple[type, ...] = (APIError, TimeoutError, ConnectionError)
+
+
+def _ui_guard(func):
+    """
+    Wraps a UI handler with the shared log-and-toast error boundary.
+
+    Handlers carry one decorator instead of each duplicating the
+    try/except/toast block. Known-transient Meraki/network errors log a
+    plain warning without the traceback walk; everything else keeps the
+    full logger.exception capture.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except _TRANSIENT_ERRORS as e:
+            logger.warning("Transient error in %s: %s", func.__name__, e)
+            self._toast_error(f"A temporary API error occurred, please retry: {e}")
+        except Exception as e:
+            logger.exception("An unexpected error occurred in %s: %s", func.__name__, e)
+            self._toast_error(f"An unexpected error occurred: {e}")
+    return wrapper
+
+
+@functools.lru_cache(maxsize=16)
+def _date_range_for(days_lookback: int, end_date_iso: str) -> Tuple[Tuple[Any, ...], Tuple[str, ...]]:
+    """
+    Returns the (date objects, date strings) axis for a lookback window.
+
+    Pure function of its arguments, so repeated renders with the same
+    lookback reuse the cached axis; keying on the end date keeps results
+    correct across midnight.
+    """
+    end_date = datetime.strptime(end_date_iso, '%Y-%m-%d').date()
+    start_date = end_date - timedelta(days=days_lookback - 1)
+    date_range = tuple(pd.date_range(start=start_date, end=end_date, freq='D').date)
+    return date_range, tuple(d.strftime('%Y-%m-%d') for d in date_range)
+
 class ProjectUI:
     """
     Manages the user interface and interaction flow for the application.
@@ -35,7 +113,6 @@ class ProjectUI:
     """
     _api_utils: MerakiAPIWrapper
     _project_logic: ProjectLogic
-    logger: logging.Logger
     app_scope_name: str
     _product_type: str
 
@@ -46,13 +123,57 @@ class ProjectUI:
         Args:
             api_utils: An instance of MerakiAPIWrapper for interacting with the Meraki API.
             app_scope_name: The name of the PyWebIO scope for UI rendering.
+
+        Raises:
+            ValueError: If api_utils is None.
         """
+        # Enforce the invariant once here instead of re-checking on every
+        # menu render.
+        if api_utils is None:
+            raise ValueError("API_Utils instance is required to initialize ProjectUI.")
         self._api_utils = api_utils
         self._project_logic = ProjectLogic(api_utils=api_utils)
-        self.logger = get_logger()
         self.app_scope_name = app_scope_name
-        self.logger.info("ProjectUI initialized with API_Utils and ProjectLogic instances.")
-
+        # Session cache of {network_id: name} maps keyed by product type, so
+        # repeated graph renders for the same product type skip the
+        # list_networks API call. Cleared on each main-menu entry.
+        self._network_names_map_cache: Dict[str, Dict[str, str]] = {}
+        # Session cache of event definitions keyed by product type, so
+        # validation-error re-entries into the selection UI don't repeat the
+        # fan-out of getNetworkEventsEventTypes calls. Cleared with the map above.
+        self._event_definitions_cache: Dict[str, List[Dict[str, str]]] = {}
+        # Derived {event_type: {description, category}} lookups, keyed by
+        # product type like the definitions they come from.
+        self._event_details_map_cache: Dict[str, Dict[str, Dict[str, str]]] = {}
+        # Derived {category: [definitions]} indexes, keyed by product type,
+        # so category filtering is a few dict lookups instead of a full scan.
+        self._defs_by_category_cache: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+        # Rendered checkbox options keyed by (product type, categories), so
+        # revisiting the event-type step reuses the built list outright.
+        self._event_type_options_cache: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[str, str]]] = {}
+        # Tracks whether the ECharts bundle <script> tag has been emitted to
+        # this session's page, so charts ship only their option JSON.
+        self._echarts_bundle_loaded: bool = False
+        # TTL cache of event-count reports keyed by
+        # (product_type, sorted event types, days_lookback), so regenerating
+        # a report with unchanged parameters skips the Meraki fetch.
+        self._event_counts_cache: Dict[Tuple[str, Tuple[str, ...], int], Tuple[float, Dict[str, Dict[str, Dict[str, int]]]]] = {}
+        # Guards against double-clicked navigation buttons dispatching the
+        # same handler twice: actions currently running and last-click times.
+        self._inflight_actions: set = set()
+        self._last_action_times: Dict[str, float] = {}
+        # Dispatch table for navigation button values; new actions register
+        # here instead of growing an if/elif ladder in the handler.
+        self._menu_actions: Dict[str, Any] = {"main_menu": self.app_main_menu}
+        # (org_id, header markdown) pair; the header only changes when the
+        # organization does, so menu re-renders reuse the built string.
+        self._org_header: Optional[Tuple[str, str]] = None
+        # Last-shown times per error toast message, kept per session so one
+        # user's suppression window never swallows another user's toast.
+        self._last_error_toasts: Dict[str, float] = {}
+        logger.info("ProjectUI initialized with API_Utils and ProjectLogic instances.")
+
+    @_ui_guard
     def app_main_menu(self) -> None:
         """
         Displays the main navigation menu for the application.
@@ -63,62 +184,72 @@ class ProjectUI:
         """
         logger.info("Entering app_main_menu function.")
 
-        if self._api_utils is None:
-            error_message = "API_Utils instance is not available. Please ensure it was set during ProjectUI initialization."
-            logger.error(error_message)
-            raise ValueError(error_message)
-
-        try:
-            clear(self.app_scope_name)
-            with use_scope(self.app_scope_name, clear=True):
-                # Display the currently selected organization's name and ID.
-                put_markdown(f"### Organization: {self._api_utils.get_organization_name()} (id: {self._api_utils.get_organization_id()})")
-                logger.info(f"Displaying main menu for organization: {self._api_utils.get_organization_name()} (id: {self._api_utils.get_organization_id()})")
-
-                # Get unique product types from project logic
-                # Assuming ProjectLogic has a method `get_unique_product_types`
-                # If not implemented yet, a hardcoded list is used as a fallback.
-                try:
-                    with put_loading():
-                        product_types = self._project_logic.get_unique_product_types()
-                except AttributeError:
-                    logger.warning("`get_unique_product_types` not found in ProjectLogic. Using hardcoded list.")
-
-                if not product_types:
-                    put_text("No product types available for selection.")
-                    return
-
-                form_data = input_group(
-                    "Select Product Type",
-                    [
-                        select(
-                            name="product_type_selection",
-                            label="Select a Product Type",
-                            options=[(pt.capitalize(),pt) for pt in product_types],
-                            required=True,
-                            help_text="Choose a Meraki product type to view its network logs."
-                        ),
-                        actions(
-                            name="action",
-                            buttons=[
-                                {"label": "Select Categories", "value": "select_categories", "color": "primary"},
-                            ]
-                        )
-                    ]
-                )
+        # Resolve the organization context once per render; both values are
+        # used twice below and each lookup may traverse the API wrapper.
+        org_name = self._api_utils.get_organization_name()
+        org_id = self._api_utils.get_organization_id()
+        if self._org_header is None or self._org_header[0] != org_id:
+            # Organization changed (or first render): the memoized network
+            # maps, event definitions and report caches belong to the old
+            # org, so drop them along with the stale header. The org is
+            # otherwise fixed for a session, so re-entering the menu keeps
+            # them warm; the event-counts entries carry their own TTL.
+            self._network_names_map_cache.clear()
+            self._event_definitions_cache.clear()
+            self._event_details_map_cache.clear()
+            self._defs_by_category_cache.clear()
+            self._event_type_options_cache.clear()
+            self._event_counts_cache.clear()
+            self._org_header = (org_id, f"### Organization: {org_name} (id: {org_id})")
+        with use_scope(self.app_scope_name, clear=True):
+            # Display the currently selected organization's name and ID.
+            put_markdown(self._org_header[1])
+            # %-style args defer formatting until the record passes the
+            # level check, keeping this render path free of string work
+            # when INFO is filtered out.
+            logger.info("Displaying main menu for organization: %s (id: %s)", org_name, org_id)
+
+            # Get unique product types from project logic
+            # Assuming ProjectLogic has a method `get_unique_product_types`
+            # If not implemented yet, a hardcoded list is used as a fallback.
+            try:
+                with put_loading():
+                    product_types = self._project_logic.get_unique_product_types()
+            except AttributeError:
+                logger.warning("`get_unique_product_types` not found in ProjectLogic. Using hardcoded list.")
+
+            if not product_types:
+                put_text("No product types available for selection.")
+                return
 
-                if form_data and form_data.get("action") == "select_categories":
-                    selected_product_type = form_data.get("product_type_selection")
-                    if selected_product_type:
-                        self.handle_product_type_selection(selected_product_type)
-                    else:
-                        toast("Please select a product type.", color="warn")
-                        self.app_main_menu() # Re-render main menu to allow selection again
+            form_data = input_group(
+                "Select Product Type",
+                [
+                    select(
+                        name="product_type_selection",
+                        label="Select a Product Type",
+                        options=[(pt.capitalize(),pt) for pt in product_types],
+                        required=True,
+                        help_text="Choose a Meraki product type to view its network logs."
+                    ),
+                    actions(
+                        name="action",
+                        buttons=[
+                            {"label": "Select Categories", "value": "select_categories", "color": "primary"},
+                        ]
+                    )
+                ]
+            )
 
-        except Exception as e:
-            logger.exception(f"An unexpected error occurred in app_main_menu: {e}")
-            toast(f"An unexpected error occurred: {e}", color="error", duration=0)
+            if form_data and form_data.get("action") == "select_categories":
+                selected_product_type = form_data.get("product_type_selection")
+                if selected_product_type:
+                    self.handle_product_type_selection(selected_product_type)
+                else:
+                    toast("Please select a product type.", color="warn")
+                    self.app_main_menu() # Re-render main menu to allow selection again
 
+    @_ui_guard
     def handle_product_type_selection(self, product_type: str) -> None:
         """
         Handles the selection of a product type from the main menu dropdown.
@@ -126,29 +257,140 @@ class ProjectUI:
         Args:
             product_type: The selected product type (e.g., "wireless", "appliance").
         """
-        logger.info(f"Handling product type selection: {product_type}")
-        try:
-            # Now calls the first step of the new multi-step UI
-            self.display_network_event_selection_ui(product_type)
-        except Exception as e:
-            logger.exception(f"An unexpected error occurred in handle_product_type_selection for product type '{product_type}': {e}")
-            toast(f"An unexpected error occurred: {e}", color="error", duration=0)
+        logger.info("Handling product type selection: %s", product_type)
+        # Now calls the first step of the new multi-step UI
+        self.display_network_event_selection_ui(product_type)
 
+    @_ui_guard
     def handle_main_menu_action(self, action: str) -> None:
         """
         Handles actions triggered from general navigation buttons (e.g., "Back to Main Menu").
         This method is kept for backward compatibility but new navigation is handled
         within the multi-step UI methods.
         """
-        logger.info(f"Handling main menu action: {action}")
+        handler = self._menu_actions.get(action)
+        if handler is None or not self._should_dispatch_action(action):
+            return
+        logger.info("Handling main menu action: %s", action)
+        self._inflight_actions.add(action)
         try:
-            if action == "main_menu":
-                self.app_main_menu()
-            # The 'networks_logs' action is now handled by more specific back buttons
-            # in the new multi-step flow.
-        except Exception as e:
-            logger.exception(f"An unexpected error occurred in handle_main_menu_action for action '{action}': {e}")
-            toast(f"An unexpected error occurred: {e}", color="error", duration=0)
+            handler()
+        finally:
+            self._inflight_actions.discard(action)
+
+    def _should_dispatch_action(self, action: str) -> bool:
+        """
+        Returns True when a button action should run, coalescing repeat
+        clicks that arrive while the same action is still in flight or
+        within the debounce window of the previous dispatch.
+
+        Args:
+            action: The button value being dispatched.
+        """
+        now = time.monotonic()
+        if action in self._inflight_actions or now - self._last_action_times.get(action, 0.0) < NAVIGATION_DEBOUNCE_SECONDS:
+            logger.info("Coalesced duplicate '%s' click.", action)
+            return False
+        self._last_action_times[action] = now
+        return True
+
+    def _toast_error(self, message: str) -> None:
+        """
+        Raises a persistent error toast, suppressing repeats of the same
+        message within ERROR_TOAST_SUPPRESS_SECONDS for this session.
+
+        Args:
+            message: The error text shown to the user.
+        """
+        now = time.monotonic()
+        if now - self._last_error_toasts.get(message, 0.0) >= ERROR_TOAST_SUPPRESS_SECONDS:
+            self._last_error_toasts[message] = now
+            toast(message, color="error", duration=0)
+
+    def _get_event_definitions(self, product_type: str) -> List[Dict[str, str]]:
+        """
+        Returns all event definitions for a product type, memoized per session
+        so validation re-entries skip the per-network event-type fan-out.
+
+        Args:
+            product_type: The Meraki product type to fetch event types for.
+
+        Returns:
+            List[Dict[str, str]]: Event definition dicts sorted by (category, type).
+        """
+        definitions = self._event_definitions_cache.get(product_type)
+        if definitions is None:
+            definitions = self._project_logic.get_filtered_event_types(
+                product_type=product_type,
+                event_category=None
+            )
+            # Empty results mean no data or a swallowed API error; don't
+            # cache them, so the next render refetches and can recover
+            # (mirrors _list_networks_cached's rule for error payloads).
+            if definitions:
+                self._event_definitions_cache[product_type] = definitions
+        return definitions
+
+    def _get_defs_by_category(self, product_type: str) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Returns a {category: [definitions]} index for a product type, built
+        once per session from the cached definitions.
+
+        Args:
+            product_type: The Meraki product type to index definitions for.
+
+        Returns:
+            Mapping of category to its definitions, each list in type order.
+        """
+        defs_by_category = self._defs_by_category_cache.get(product_type)
+        if defs_by_category is None:
+            defs_by_category = {}
+            for event_def in self._get_event_definitions(product_type):
+                defs_by_category.setdefault(event_def.get("category", "Uncategorized"), []).append(event_def)
+            # An empty index means the definitions fetch came back empty
+            # (possibly an error); leave it uncached so a later call retries.
+            if defs_by_category:
+                self._defs_by_category_cache[product_type] = defs_by_category
+        return defs_by_category
+
+    def _get_event_type_options(self, product_type: str, selected_categories: List[str]) -> List[Tuple[str, str]]:
+        """
+        Builds the event-type checkbox options for a category selection,
+        memoized per (product type, categories) so revisits skip the rebuild.
+
+        Args:
+            product_type: The Meraki product type the options cover.
+            selected_categories: Categories whose event types are included.
+
+        Returns:
+            List of (label, event_type) option tuples in (category, type) order.
+        """
+        options_key = (product_type, tuple(sorted(selected_categories)))
+        checkbox_options = self._event_type_options_cache.get(options_key)
+        if checkbox_options is not None:
+            return checkbox_options
+
+        # The per-category index holds definitions in (category, type)
+        # order; chaining in sorted category order preserves it. The
+        # seen-set drops (category, type) duplicates, which can occur when
+        # networks report differing descriptions for the same type.
+        defs_by_category = self._get_defs_by_category(product_type)
+        checkbox_options = []
+        seen_definitions: set = set()
+        for event_def in itertools.chain.from_iterable(
+            defs_by_category.get(category, []) for category in sorted(selected_categories)
+        ):
+            event_type = event_def.get("type", "Unknown Type")
+            description = event_def.get("description", "No description available")
+            category = event_def.get("category", "Uncategorized")
+            definition_key = (category, event_type)
+            if definition_key in seen_definitions:
+                continue
+            seen_definitions.add(definition_key)
+            checkbox_options.append((f"[{category.capitalize()}] {description} ({event_type})", event_type))
+
+        self._event_type_options_cache[options_key] = checkbox_options
+        return checkbox_options
 
     def display_network_event_selection_ui(self, product_type: str) -> None:
         """
@@ -156,17 +398,15 @@ class ProjectUI:
         This is the first step in a multi-stage event selection process.
         """
         logger.info(f"Entering display_network_event_selection_ui (category selection) for product type: {product_type}.")
-        clear(self.app_scope_name)
         with use_scope(self.app_scope_name, clear=True):
             with put_loading():
-                all_event_definitions = self._project_logic.get_filtered_event_types(
-                    product_type=product_type,
-                    event_category=None # Get all categories for the selected product type
-                )
+                # Memoized per product type, so re-entering this step after a
+                # validation error costs a dict lookup instead of API calls.
+                all_event_definitions = self._get_event_definitions(product_type)
 
             if not all_event_definitions:
                 toast(f"No network event types found for {product_type} networks or an error occurred.",color="warn")
-                put_buttons([{"label": "Back to Main Menu", "value": "main_menu"}], onclick=self.handle_main_menu_action)
+                put_buttons(_BACK_TO_MAIN_MENU_BUTTONS, onclick=self.handle_main_menu_action)
                 return
 
             unique_categories = sorted(list(set(ed.get("category", "Uncategorized") for ed in all_event_definitions)))
@@ -175,79 +415,66 @@ class ProjectUI:
             for category in unique_categories:
                 category_checkbox_options.append((category, category))
 
-            form_data = input_group(
-                f"Select Categories for network events",
-                [
-                    checkbox(
-                        name="selected_categories",
-                        options=category_checkbox_options,
-                        help_text="Check one or more categories to view their event types."
-                    ),
-                    actions(
-                        name="action",
-                        buttons=[
-                            {"label": "Continue to Event Types", "value": "continue_to_event_types", "color": "primary"},
-                            {"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}
-                        ]
-                    )
-                ]
-            )
+            # Loop instead of recursing on validation errors: only the form
+            # is re-prompted, without wiping the scope or rebuilding options.
+            while True:
+                form_data = input_group(
+                    f"Select Categories for network events",
+                    [
+                        checkbox(
+                            name="selected_categories",
+                            options=category_checkbox_options,
+                            help_text="Check one or more categories to view their event types."
+                        ),
+                        actions(
+                            name="action",
+                            buttons=[
+                                {"label": "Continue to Event Types", "value": "continue_to_event_types", "color": "primary"},
+                                {"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}
+                            ]
+                        )
+                    ]
+                )
+
+                if not form_data:
+                    put_text("No selection made or action cancelled.")
+                    self.app_main_menu() # Go back to main menu if cancelled
+                    return
 
-            if form_data:
                 action = form_data.get("action")
                 selected_categories: List[str] = form_data.get("selected_categories", [])
 
-                if action == "continue_to_event_types":
-                    if not selected_categories:
-                        toast("Please select at least one category.", color="warn")
-                        # Re-render this step to allow selection again
-                        self.display_network_event_selection_ui(product_type)
-                        return
-                    # Call the next step with the selected categories
-                    self._display_event_types_for_selected_categories(product_type, selected_categories)
-                elif action == "main_menu":
-                    self.app_main_menu()
-            else:
-                put_text("No selection made or action cancelled.")
-                self.app_main_menu() # Go back to main menu if cancelled
+                if action == "continue_to_event_types" and not selected_categories:
+                    toast("Please select at least one category.", color="warn")
+                    continue
+                break
+
+            if action == "continue_to_event_types":
+                # Call the next step with the selected categories
+                self._display_event_types_for_selected_categories(product_type, selected_categories)
+            elif action == "main_menu":
+                self.app_main_menu()
 
-    def _display_event_types_for_selected_categories(self, product_type: str, selected_categories: List[str], previously_selected_types: Optional[List[str]] = None) -> None:
+    def _display_event_types_for_selected_categories(self, product_type: str, selected_categories: List[str], previously_selected_types: Optional[List[str]] = None, type_filter: str = "") -> None:
         """
         Displays event types aggregated from chosen categories and allows selection.
         This is the second step in the multi-stage event selection process.
+
+        A free-text filter narrows the checkbox list server-side before it is
+        shipped to the browser, keeping the form responsive for product types
+        with hundreds of event types.
         """
         logger.info(f"Displaying event types for selected categories: {selected_categories} for product type: {product_type}")
-        clear(self.app_scope_name)
         with use_scope(self.app_scope_name, clear=True):
 
-            # Get all event definitions for the selected product type
-            all_event_definitions = self._project_logic.get_filtered_event_types(
-                product_type=product_type,
-                event_category=None # Get all to filter by selected_categories
-            )
-
-            # Filter event definitions based on selected_categories
-            filtered_event_definitions = [
-                ed for ed in all_event_definitions
-                if ed.get("category", "Uncategorized") in selected_categories
-            ]
+            checkbox_options = self._get_event_type_options(product_type, selected_categories)
 
-            if not filtered_event_definitions:
+            if not checkbox_options:
                 put_text(f"No event types found for the selected categories: {', '.join(selected_categories)}.")
-                put_buttons([{"label": "Back to Main Menu", "value": "main_menu"}],
+                put_buttons(_BACK_TO_MAIN_MENU_BUTTONS,
                             onclick=lambda btn: self._handle_navigation_from_event_types_no_events(product_type, btn))
                 return
 
-            checkbox_options: List[Tuple[str, str]] = []
-            # Sort events by category then by type for better readability
-            sorted_filtered_events = sorted(filtered_event_definitions, key=lambda x: (x.get("category", ""), x.get("type", "")))
-
-            for event_def in sorted_filtered_events:
-                event_type = event_def.get("type", "Unknown Type")
-                description = event_def.get("description", "No description available")
-                category = event_def.get("category", "Uncategorized")
-                checkbox_options.append((f"[{category.capitalize()}] {description} ({event_type})", event_type))
-
             # --- MODIFICATION START ---
             # If previously_selected_types is None, it means this is the initial load,
             # so select all available event types by default.
@@ -255,41 +482,75 @@ class ProjectUI:
                 previously_selected_types = [opt[1] for opt in checkbox_options]
             # --- MODIFICATION END ---
 
-            form_data = input_group(
-                f"Select Event Types",
-                [
-                    checkbox(
-                        name="selected_event_types",
-                        options=checkbox_options,
-                        value=previously_selected_types, # Pre-fill if coming back or initially selecting all
-                        help_text="Check all event types you wish to analyze."
-                    ),
-                    actions(
-                        name="action",
-                        buttons=[
-                            {"label": "Continue to Timeframe", "value": "continue_to_timeframe", "color": "primary"},
-                            {"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}
-                        ]
-                    )
-                ]
-            )
+            # Loop instead of recursing: filter refreshes and validation
+            # errors only re-prompt the form, reusing the options built above.
+            while True:
+                # Narrow the options server-side before rendering so the
+                # browser only receives the rows matching the filter text.
+                displayed_options = checkbox_options
+                filter_text = type_filter.strip().lower()
+                if filter_text:
+                    filtered_options = [opt for opt in checkbox_options if filter_text in opt[0].lower()]
+                    if filtered_options:
+                        displayed_options = filtered_options
+                    else:
+                        toast(f"No event types match '{type_filter.strip()}'. Showing all.", color="warn")
+                        type_filter = ""
+
+                form_data = input_group(
+                    f"Select Event Types",
+                    [
+                        pywebio_input(
+                            name="type_filter",
+                            label="Filter event types",
+                            type="text",
+                            value=type_filter,
+                            help_text="Optional text to narrow the list below; press 'Apply Filter' to refresh."
+                        ),
+                        checkbox(
+                            name="selected_event_types",
+                            options=displayed_options,
+                            value=previously_selected_types, # Pre-fill if coming back or initially selecting all
+                            help_text="Check all event types you wish to analyze."
+                        ),
+                        actions(
+                            name="action",
+                            buttons=[
+                                {"label": "Continue to Timeframe", "value": "continue_to_timeframe", "color": "primary"},
+                                {"label": "Apply Filter", "value": "apply_filter", "color": "info"},
+                                {"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}
+                            ]
+                        )
+                    ]
+                )
+
+                if not form_data:
+                    put_text("No selection made or action cancelled.")
+                    self.display_network_event_selection_ui(product_type) # Go back to category selection if cancelled
+                    return
 
-            if form_data:
                 action = form_data.get("action")
                 selected_types: List[str] = form_data.get("selected_event_types", [])
 
-                if action == "continue_to_timeframe":
-                    if not selected_types:
-                        toast("Please select at least one event type.", color="warn")
-                        # Re-render this step to allow selection again
-                        self._display_event_types_for_selected_categories(product_type, selected_categories, previously_selected_types=selected_types)
-                        return
-                    self._display_lookback_period_selection(product_type, selected_categories, selected_types) # Pass selected_categories list
-                elif action == "main_menu":
-                    self.app_main_menu()
-            else:
-                put_text("No selection made or action cancelled.")
-                self.display_network_event_selection_ui(product_type) # Go back to category selection if cancelled
+                if action == "apply_filter":
+                    # Re-prompt with the new filter. The form only reports
+                    # types it displayed, so merge in previously selected
+                    # types the filter hid instead of unchecking them.
+                    type_filter = form_data.get("type_filter") or ""
+                    displayed_set = {opt[1] for opt in displayed_options}
+                    previously_selected_types = selected_types + [
+                        t for t in previously_selected_types if t not in displayed_set
+                    ]
+                    continue
+                if action == "continue_to_timeframe" and not selected_types:
+                    toast("Please select at least one event type.", color="warn")
+                    continue
+                break
+
+            if action == "continue_to_timeframe":
+                self._display_lookback_period_selection(product_type, selected_categories, selected_types) # Pass selected_categories list
+            elif action == "main_menu":
+                self.app_main_menu()
 
     def _display_lookback_period_selection(self, product_type: str, selected_categories: List[str], selected_event_types: List[str], previously_days_lookback: Optional[int] = None) -> None:
         """
@@ -297,75 +558,200 @@ class ProjectUI:
         This is the third and final step in the multi-stage event selection process.
         """
         logger.info(f"Displaying lookback period selection for product type: {product_type}, categories: {selected_categories}, event types: {selected_event_types}")
-        clear(self.app_scope_name)
         with use_scope(self.app_scope_name, clear=True):
-            form_data = input_group(
-                "Timeframe Selection",
-                [
-                    pywebio_input(
-                        name="days_lookback",
-                        label="Days to look back for events",
-                        type="number",
-                        value=previously_days_lookback if previously_days_lookback else 7,
-                        min=1,
-                        max=90,
-                        help_text="Enter the number of days to retrieve events for (max 90)."
-                    ),
-                    actions(
-                        name="action",
-                        buttons=[
-                            {"label": "Generate Report", "value": "generate_report", "color": "primary"},
-                            {"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}
-                        ]
-                    )
-                ]
-            )
+            # Loop instead of recursing on validation errors, so retries only
+            # re-prompt the form rather than wiping and repainting the scope.
+            while True:
+                form_data = input_group(
+                    "Timeframe Selection",
+                    [
+                        pywebio_input(
+                            name="days_lookback",
+                            label="Days to look back for events",
+                            type="number",
+                            value=previously_days_lookback if previously_days_lookback else 7,
+                            min=1,
+                            max=90,
+                            help_text="Enter the number of days to retrieve events for (max 90)."
+                        ),
+                        pywebio_input(
+                            name="max_networks",
+                            label="Max network lines per chart",
+                            type="number",
+                            value=DEFAULT_MAX_NETWORK_SERIES,
+                            min=1,
+                            max=50,
+                            help_text="Busiest networks are drawn individually; the rest are grouped into an 'Other' line."
+                        ),
+                        actions(
+                            name="action",
+                            buttons=[
+                                {"label": "Generate Report", "value": "generate_report", "color": "primary"},
+                                {"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}
+                            ]
+                        )
+                    ]
+                )
+
+                if not form_data:
+                    put_text("No selection made or action cancelled.")
+                    self._display_event_types_for_selected_categories(product_type, selected_categories, previously_selected_types=selected_event_types)
+                    return
 
-            if form_data:
                 action = form_data.get("action")
                 days_lookback_raw = form_data.get("days_lookback")
 
                 if action == "generate_report":
                     try:
                         days_lookback: int = int(days_lookback_raw)
-                        if not (1 <= days_lookback <= 90):
-                            toast("Days lookback must be a number between 1 and 90.", color="warn")
-                            self._display_lookback_period_selection(product_type, selected_categories, selected_event_types, previously_days_lookback=days_lookback)
-                            return
+                        max_network_series: int = int(form_data.get("max_networks") or DEFAULT_MAX_NETWORK_SERIES)
                     except (ValueError, TypeError):
                         toast("Invalid value for 'Days to look back'. Please enter a number.", color="warn")
-                        self._display_lookback_period_selection(product_type, selected_categories, selected_event_types)
-                        return
+                        continue
+                    if not (1 <= days_lookback <= 90):
+                        toast("Days lookback must be a number between 1 and 90.", color="warn")
+                        previously_days_lookback = days_lookback
+                        continue
+                    if not (1 <= max_network_series <= 50):
+                        toast("Max network lines must be a number between 1 and 50.", color="warn")
+                        continue
+                break
+
+            if action == "generate_report":
+                self._generate_report_and_graph(product_type, selected_event_types, days_lookback, selected_categories, max_network_series) # Pass selected_categories list
+            elif action == "main_menu":
+                self.app_main_menu()
 
-                    self._generate_report_and_graph(product_type, selected_event_types, days_lookback, selected_categories) # Pass selected_categories list
+    def _get_event_details_map(self, product_type: str) -> Dict[str, Dict[str, str]]:
+        """
+        Returns a {event_type: {description, category}} lookup for a product
+        type, memoized per session alongside the definitions it derives from.
 
-                elif action == "main_menu":
-                    self.app_main_menu()
-            else:
-                put_text("No selection made or action cancelled.")
-                self._display_event_types_for_selected_categories(product_type, selected_categories, previously_selected_types=selected_event_types)
+        Args:
+            product_type: The Meraki product type to build the lookup for.
 
-    def _generate_report_and_graph(self, product_type: str, selected_event_types: List[str], days_lookback: int, selected_categories: List[str]) -> None:
+        Returns:
+            Mapping of event type to its description and category.
         """
-        Fetches event counts and displays the graph. This is the final display step.
+        details_map = self._event_details_map_cache.get(product_type)
+        if details_map is None:
+            details_map = {
+                ed.get("type"): {
+                    "description": ed.get("description", "No description available"),
+                    "category": ed.get("category", "Uncategorized")
+                }
+                for ed in self._get_event_definitions(product_type) if ed.get("type")
+            }
+            # Same retry rule as the definitions cache: empty lookups are
+            # not worth pinning for the session.
+            if details_map:
+                self._event_details_map_cache[product_type] = details_map
+        return details_map
+
+    def _get_event_counts_cached(self, product_type: str, selected_event_types: List[str], days_lookback: int) -> Dict[str, Dict[str, Dict[str, int]]]:
         """
-        logger.info(f"Generating report for product type: {product_type}, event types: {selected_event_types}, days_lookback: {days_lookback}, categories: {selected_categories}")
+        Fetches event counts via ProjectLogic, reusing a recent result when the
+        report parameters are identical.
 
-        toast("Fetching event counts... This may take a moment.", color="info", duration=5)
-        with put_loading():
+        Args:
+            product_type: The Meraki product type the report covers.
+            selected_event_types: Event types included in the report.
+            days_lookback: The number of days the report covers.
+
+        Returns:
+            The nested event counts structure from get_network_event_counts.
+        """
+        cache_key = (product_type, tuple(sorted(selected_event_types)), days_lookback)
+        cached = self._event_counts_cache.get(cache_key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < EVENT_COUNTS_CACHE_TTL_SECONDS:
+            logger.info(f"Using cached event counts for {cache_key[0]} ({len(cache_key[1])} event types, {days_lookback} days).")
+            return cached[1]
+
+        # Second-level disk cache: the digest covers the org and the
+        # calendar day, so identical reports survive a process restart
+        # without refetching and roll over naturally at midnight.
+        disk_path = self._event_counts_disk_path(product_type, cache_key[1], days_lookback)
+        event_counts_data = self._read_event_counts_from_disk(disk_path)
+        if event_counts_data is None:
             event_counts_data = self._project_logic.get_network_event_counts(
                 product_type=product_type,
                 selected_event_types=selected_event_types,
                 days_lookback=days_lookback
             )
-        clear(self.app_scope_name)
+            self._write_event_counts_to_disk(disk_path, event_counts_data)
+        self._event_counts_cache[cache_key] = (now, event_counts_data)
+        return event_counts_data
+
+    def _event_counts_disk_path(self, product_type: str, event_types_key: Tuple[str, ...], days_lookback: int) -> str:
+        """
+        Returns the on-disk cache path for a report parameter combination.
+        """
+        digest = hashlib.blake2b(json.dumps({
+            'org': self._api_utils.get_organization_id(),
+            'pt': product_type,
+            'ev': list(event_types_key),
+            'd': days_lookback,
+            'day': datetime.now().date().isoformat(),
+        }, sort_keys=True).encode()).hexdigest()
+        return os.path.join(EVENT_COUNTS_DISK_CACHE_DIR, f"{digest}.json")
+
+    def _read_event_counts_from_disk(self, disk_path: str) -> Optional[Dict[str, Dict[str, Dict[str, int]]]]:
+        """
+        Loads cached event counts from disk, or None when absent/unreadable.
+        """
+        try:
+            with open(disk_path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            logger.info(f"Using on-disk event counts cache: {disk_path}")
+            return data
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable event counts cache file {disk_path}: {e}")
+            return None
+
+    def _write_event_counts_to_disk(self, disk_path: str, event_counts_data: Dict[str, Dict[str, Dict[str, int]]]) -> None:
+        """
+        Persists event counts to disk and prunes entries past their max age.
+        The cache is best-effort; failures only cost the next restart a fetch.
+        """
+        try:
+            os.makedirs(EVENT_COUNTS_DISK_CACHE_DIR, exist_ok=True)
+            with open(disk_path, "w", encoding="utf-8") as cache_file:
+                json.dump(event_counts_data, cache_file)
+            cutoff = time.time() - EVENT_COUNTS_DISK_CACHE_MAX_AGE_SECONDS
+            for entry in os.listdir(EVENT_COUNTS_DISK_CACHE_DIR):
+                entry_path = os.path.join(EVENT_COUNTS_DISK_CACHE_DIR, entry)
+                if entry.endswith(".json") and os.path.getmtime(entry_path) < cutoff:
+                    os.remove(entry_path)
+        except Exception as e:
+            logger.warning(f"Could not persist event counts cache to {disk_path}: {e}")
+
+    def _generate_report_and_graph(self, product_type: str, selected_event_types: List[str], days_lookback: int, selected_categories: List[str], max_network_series: int = DEFAULT_MAX_NETWORK_SERIES) -> None:
+        """
+        Fetches event counts and displays the graph. This is the final display step.
+        """
+        logger.info(f"Generating report for product type: {product_type}, event types: {selected_event_types}, days_lookback: {days_lookback}, categories: {selected_categories}")
+
+        toast("Fetching event counts... This may take a moment.", color="info", duration=5)
+        with put_loading():
+            # The counts fetch and the network name map are independent
+            # round trips; running them from a small thread pool overlaps
+            # their latency, and the graph's later map lookup becomes a
+            # cache hit.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                counts_future = executor.submit(self._get_event_counts_cached, product_type, selected_event_types, days_lookback)
+                names_future = executor.submit(self._get_network_names_map, product_type)
+                event_counts_data = counts_future.result()
+                names_future.result()
         with use_scope(self.app_scope_name, clear=True):
             display_title = f"{product_type.capitalize()} Network Event Counts for Categories: {', '.join([c.capitalize() for c in selected_categories])}"
-            put_buttons([{"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}],
+            put_buttons(_BACK_TO_MAIN_MENU_BUTTONS,
                         onclick=lambda btn_val: self._handle_navigation_from_report(btn_val))
-            self.display_event_counts_graph(product_type, event_counts_data, days_lookback, display_title)
+            self.display_event_counts_graph(product_type, event_counts_data, days_lookback, display_title, max_network_series)
 
-            put_buttons([{"label": "Back to Main Menu", "value": "main_menu", "color": "secondary"}],
+            put_buttons(_BACK_TO_MAIN_MENU_BUTTONS,
                         onclick=lambda btn_val: self._handle_navigation_from_report(btn_val))
 
     def _handle_navigation_from_report(self, action: str, ) -> None:
@@ -373,19 +759,38 @@ class ProjectUI:
         Handles navigation actions from the report display.
         """
         if action == "main_menu":
-            self.app_main_menu()
+            self.handle_main_menu_action(action)
 
     def _handle_navigation_from_event_types_no_events(self, product_type: str, action: str) -> None:
         """
         Handles navigation actions from event type selection when no events are found for a category.
         """
         if action == "main_menu":
-            self.app_main_menu()
+            self.handle_main_menu_action(action)
 
-    def display_event_counts_graph(self, product_type: str, event_counts_data: Dict[str, Dict[str, Dict[str, int]]], days_lookback: int, display_title: str) -> None:
+    def _get_network_names_map(self, product_type: str) -> Dict[str, str]:
+        """
+        Returns a {network_id: network_name} map for the given product type,
+        memoized per session so repeated graph renders reuse one API call.
+
+        Args:
+            product_type: The Meraki product type to filter networks by.
+
+        Returns:
+            Dict[str, str]: Mapping of network IDs to network names.
+        """
+        names_map = self._network_names_map_cache.get(product_type)
+        if names_map is None:
+            networks_list = self._api_utils.list_networks(filter_product_type=[product_type])
+            names_map = {net['id']: net['name'] for net in networks_list}
+            self._network_names_map_cache[product_type] = names_map
+        return names_map
+
+    def display_event_counts_graph(self, product_type: str, event_counts_data: Dict[str, Dict[str, Dict[str, int]]], days_lookback: int, display_title: str, max_network_series: int = DEFAULT_MAX_NETWORK_SERIES) -> None:
         """
         Displays aggregated event counts in interactive line charts using PyEcharts and PyWebIO.
-        Generates one chart per event type, with a separate line for each network and a total line.
+        Generates one chart per event type, with a separate line for each of the busiest
+        networks, an 'Other' aggregate for the remainder, and a total line.
 
         Args:
             product_type: The Meraki product type (e.g., 'wireless', 'appliance').
@@ -393,59 +798,151 @@ class ProjectUI:
                                     dictionaries of daily counts.
             days_lookback: The number of days the data covers.
             display_title: The title for the overall graph section.
+            max_network_series: Cap on individually drawn network lines per chart.
         """
-        networks_list=self._api_utils.list_networks(filter_product_type=[product_type])
-        network_names_map = {net['id']: net['name'] for net in networks_list}
+        # Nothing to plot: bail out before spending a list_networks call on
+        # the name map for an empty report.
+        if not event_counts_data:
+            put_markdown(f"## No events were collected for any network in the last {days_lookback} days.")
+            return
 
-        flat_data = []
-        for network_id, daily_counts in event_counts_data.items():
-            current_network_name = network_names_map.get(network_id, f"Unknown Network ({network_id})")
-            for date_str, event_types_counts in daily_counts.items():
-                for event_type, count in event_types_counts.items():
-                    flat_data.append({
-                        'Date': pd.to_datetime(date_str).date(),
-                        'NetworkID': network_id,
-                        'NetworkName': current_network_name,
-                        'EventType': event_type,
-                        'Count': count
-                    })
-
-        if not flat_data:
+        network_names_map = self._get_network_names_map(product_type)
+
+        # Chart construction is pure pandas/pyecharts CPU work with no UI
+        # side effects, factored out of this method so the render step stays
+        # a thin emitter. The spinner keeps the gap between fetch and render
+        # from looking like a hang on large reports.
+        with put_loading():
+            charts_html = self._build_report_charts_html(
+                product_type, event_counts_data, days_lookback,
+                max_network_series, network_names_map
+            )
+
+        if charts_html is None:
             put_markdown(f"## No events were collected for any network in the last {days_lookback} days.")
             return
 
-        df_all_events = pd.DataFrame(flat_data)
-        df_all_events = df_all_events.sort_values(by=['EventType', 'Date', 'NetworkName'])
+        # The heading, bundle script and charts are collected into html_parts
+        # and emitted as one put_html at the end: each put_* call is a
+        # websocket round-trip to the browser, so batching everything the
+        # report renders saves N messages and browser layout passes.
+        html_parts: List[str] = [f"<h1>{display_title} (Last {days_lookback} Days)</h1>"]
+
+        # Load the ECharts bundle once per session; every chart after that
+        # ships only its option JSON instead of re-embedding the ~1MB library
+        # the way render_notebook() does.
+        if not self._echarts_bundle_loaded:
+            html_parts.append('<script src="https://cdn.jsdelivr.net/npm/echarts@5/dist/echarts.min.js"></script>')
+            self._echarts_bundle_loaded = True
 
-        put_markdown(f"# {display_title} (Last {days_lookback} Days)")
+        html_parts.append(charts_html)
+        put_html("".join(html_parts))
+
+    def _build_report_charts_html(self, product_type: str, event_counts_data: Dict[str, Dict[str, Dict[str, int]]], days_lookback: int, max_network_series: int, network_names_map: Dict[str, str]) -> Optional[str]:
+        """
+        Builds the combined chart HTML for a report without touching the UI.
 
-        page = Page()
+        Pure CPU work (pandas/NumPy/pyecharts), safe to run on a worker
+        thread; the caller handles all put_* emission.
+
+        Returns:
+            The concatenated chart snippets, or None when no rows survive.
+        """
+        # Imported lazily so cold-starting the UI doesn't pay for the
+        # sizeable pyecharts import tree until a graph is actually rendered;
+        # the import cache makes subsequent calls free.
+        from pyecharts import options as opts
+        from pyecharts.charts import Line
+
+        # Build four parallel column lists instead of a dict per row, so the
+        # DataFrame is constructed straight from column blocks without
+        # re-hashing the keys for every event row. Network names are not
+        # materialized per row: the chart loop resolves them per series
+        # from network_names_map.
+        dates: List[str] = []
+        network_ids: List[str] = []
+        event_types: List[str] = []
+        counts: List[int] = []
+        for network_id, daily_counts in event_counts_data.items():
+            for date_str, event_types_counts in daily_counts.items():
+                for event_type, count in event_types_counts.items():
+                    dates.append(date_str)
+                    network_ids.append(network_id)
+                    event_types.append(event_type)
+                    counts.append(count)
+
+        if not dates:
+            return None
+
+        # Columns are typed at construction: dates parsed in one vectorized
+        # pass instead of a scalar call per row, low-cardinality string
+        # columns as categoricals (integer codes instead of str hashing),
+        # and counts as a ready int32 block with no dtype inference.
+        df_all_events = pd.DataFrame({
+            'Date': pd.to_datetime(dates, format='%Y-%m-%d').date,
+            'NetworkID': pd.Categorical(network_ids),
+            'EventType': pd.Categorical(event_types),
+            'Count': np.asarray(counts, dtype=np.int32)
+        })
+
+        html_parts: List[str] = []
 
         today_date = datetime.now().date()
         start_date = today_date - timedelta(days=days_lookback - 1)
-        full_date_range = pd.date_range(start=start_date, end=today_date, freq='D').date
-        full_date_range_str = [d.strftime('%Y-%m-%d') for d in full_date_range]
+        full_date_range, full_date_range_str = _date_range_for(days_lookback, today_date.isoformat())
 
         # --- MODIFICATION START ---
-        # Fetch all event definitions for the product type to get descriptions and categories
-        all_event_definitions = self._project_logic.get_filtered_event_types(
-            product_type=product_type,
-            event_category=None # Get all to build the lookup
-        )
-        event_details_map = {
-            ed.get("type"): {
-                "description": ed.get("description", "No description available"),
-                "category": ed.get("category", "Uncategorized")
-            }
-            for ed in all_event_definitions if ed.get("type")
-        }
+        # Lookup of description/category per event type, memoized alongside
+        # the event definitions it is derived from.
+        event_details_map = self._get_event_details_map(product_type)
         # --- MODIFICATION END ---
 
 
-        for target_event_type in sorted(df_all_events['EventType'].unique()):
-            df_event_type = df_all_events[df_all_events['EventType'] == target_event_type]
+        # One np.add.at scatter-add over the categorical codes accumulates
+        # every row into a dense (event types x networks x days) cube in a
+        # single O(rows) C pass, replacing the groupby/unstack/reindex
+        # pipeline that materialized intermediate frames per reshape step.
+        event_type_categories = df_all_events['EventType'].cat.categories
+        network_categories = df_all_events['NetworkID'].cat.categories
+        event_type_codes = df_all_events['EventType'].cat.codes.to_numpy()
+        network_codes = df_all_events['NetworkID'].cat.codes.to_numpy()
+        day_codes = (pd.to_datetime(df_all_events['Date']) - pd.Timestamp(start_date)).dt.days.to_numpy()
+        count_values = df_all_events['Count'].to_numpy()
+
+        # Events timestamped outside the lookback window (clock skew on the
+        # first/last day) would index past the cube; drop them.
+        in_window = (day_codes >= 0) & (day_codes < len(full_date_range))
+        counts_cube = np.zeros(
+            (len(event_type_categories), len(network_categories), len(full_date_range)),
+            dtype=np.int32,
+        )
+        np.add.at(
+            counts_cube,
+            (event_type_codes[in_window], network_codes[in_window], day_codes[in_window]),
+            count_values[in_window],
+        )
 
-            network_series_data_map = {}
+        # Bound once before the loop: these constructors are hit for every
+        # series of every chart, and the constant styles are shared data
+        # holders, so the hot loop skips repeated attribute lookups and
+        # option re-allocation.
+        MarkPointOpts = opts.MarkPointOpts
+        MarkPointItem = opts.MarkPointItem
+        series_line_style = opts.LineStyleOpts(width=2)
+        other_line_style = opts.LineStyleOpts(width=2, type_="dashed")
+        totals_line_style = opts.LineStyleOpts(width=4, type_="solid", opacity=0.8)
+        totals_item_style = opts.ItemStyleOpts(color="#FF0000")
+        hidden_labels = opts.LabelOpts(is_show=False)
+
+        for type_index, target_event_type in enumerate(event_type_categories):
+            # (networks x days) int32 slice for this event type; categorical
+            # categories are lexically sorted, so chart order is unchanged.
+            series_matrix = counts_cube[type_index]
+
+            # Nothing survived the window mask for this type: skip before
+            # paying for Line construction and its axis/legend options.
+            if not series_matrix.any():
+                continue
 
             # --- MODIFICATION START ---
             event_detail = event_details_map.get(target_event_type, {})
@@ -478,47 +975,78 @@ class ProjectUI:
                 )
             )
 
-            for network_id, network_name in network_names_map.items():
-                df_network_event_type = df_event_type[df_event_type['NetworkID'] == network_id].set_index('Date')
-
-                series_data = df_network_event_type['Count'].reindex(full_date_range, fill_value=0).tolist()
-                network_series_data_map[network_name] = series_data
-
-                if any(count > 0 for count in series_data):
-                    l.add_yaxis(
-                        series_name=network_name,
-                        y_axis=series_data,
-                        linestyle_opts=opts.LineStyleOpts(width=2),
-                        label_opts=opts.LabelOpts(is_show=False),
-                        markpoint_opts=opts.MarkPointOpts(
-                            data=[
-                                opts.MarkPointItem(type_="max", name="Max Value"),
-                                opts.MarkPointItem(type_="min", name="Min Value"),
-                            ]
-                        )
+            # Only the max_network_series busiest networks get their own
+            # line; the rest collapse into one 'Other' series so charts for
+            # large orgs don't serialize hundreds of series into the page.
+            network_totals = series_matrix.sum(axis=1)
+            active_rows = np.flatnonzero(network_totals)
+            other_rows: List[int] = []
+            if len(active_rows) > max_network_series:
+                ranked_rows = active_rows[np.argsort(network_totals[active_rows])][::-1]
+                top_rows = np.sort(ranked_rows[:max_network_series])
+                other_rows = ranked_rows[max_network_series:].tolist()
+            else:
+                top_rows = active_rows
+
+            for row_index in top_rows:
+                series_row = series_matrix[row_index]
+                network_id = network_categories[row_index]
+                network_name = network_names_map.get(network_id, f"Unknown Network ({network_id})")
+                # Fixed coordinates computed once here spare ECharts a
+                # client-side extrema scan over every series; only the peak
+                # is marked (the minimum is usually just a zero day), and a
+                # flat series gets no marker at all.
+                max_index = int(series_row.argmax())
+                if series_row[max_index] != series_row.min():
+                    markpoint_opts = MarkPointOpts(
+                        data=[MarkPointItem(coord=[full_date_range_str[max_index], int(series_row[max_index])], name="Max Value")]
                     )
+                else:
+                    markpoint_opts = None
+                l.add_yaxis(
+                    series_name=network_name,
+                    y_axis=series_row.tolist(),
+                    linestyle_opts=series_line_style,
+                    label_opts=hidden_labels,
+                    markpoint_opts=markpoint_opts
+                )
 
-            total_event_counts_for_type = [0] * len(full_date_range)
-            for i in range(len(full_date_range)):
-                for network_name in network_series_data_map:
-                    total_event_counts_for_type[i] += network_series_data_map[network_name][i]
+            if other_rows:
+                other_series = series_matrix[other_rows].sum(axis=0)
+                l.add_yaxis(
+                    series_name=f"Other ({len(other_rows)} networks)",
+                    y_axis=other_series.tolist(),
+                    linestyle_opts=other_line_style,
+                    label_opts=hidden_labels
+                )
 
-            if any(count > 0 for count in total_event_counts_for_type):
+            # The total line is a single column-wise NumPy reduction over the
+            # series matrix instead of a Python double loop over days x networks.
+            totals = series_matrix.sum(axis=0)
+
+            if totals.any():
+                totals_max_index = int(totals.argmax())
+                if totals[totals_max_index] != totals.min():
+                    totals_markpoint_opts = MarkPointOpts(
+                        data=[MarkPointItem(coord=[full_date_range_str[totals_max_index], int(totals[totals_max_index])], name="Max Total")]
+                    )
+                else:
+                    totals_markpoint_opts = None
                 l.add_yaxis(
                     "Total Events",
-                    total_event_counts_for_type,
-                    linestyle_opts=opts.LineStyleOpts(width=4, type_="solid", opacity=0.8),
-                    itemstyle_opts=opts.ItemStyleOpts(color="#FF0000"),
-                    label_opts=opts.LabelOpts(is_show=False),
-                    markpoint_opts=opts.MarkPointOpts(
-                        data=[
-                            opts.MarkPointItem(type_="max", name="Max Total"),
-                            opts.MarkPointItem(type_="min", name="Min Total"),
-                        ]
-                    )
+                    totals.tolist(),
+                    linestyle_opts=totals_line_style,
+                    itemstyle_opts=totals_item_style,
+                    label_opts=hidden_labels,
+                    markpoint_opts=totals_markpoint_opts
                 )
 
             if l.options.get('series'):
-                page.add(l)
+                chart_div_id = f"evt_chart_{uuid.uuid4().hex}"
+                option_json = l.dump_options_with_quotes()
+                html_parts.append(
+                    f'<div id="{chart_div_id}" style="width:1400px;height:325px;"></div>'
+                    f'<script>echarts.init(document.getElementById("{chart_div_id}")).setOption({option_json});</script>'
+                )
 
-        put_html(page.render_notebook())
\ No newline at end of file
+        return "".join(html_parts) if html_parts else None
\ No newline at end of file